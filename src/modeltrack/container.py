@@ -1,25 +1,171 @@
 from collections.abc import Sequence
-from copy import deepcopy, copy
-from pickle import dump, load
+from copy import copy
+from pickle import dump, load, HIGHEST_PROTOCOL
+from types import GenericAlias
 
-from .detail import Color, Paint, Decal
+from .detail import Color, Paint, Decal, _SEQ_TYPES
 
 __all__ = ('HashMap', 'PaintMap', 'Part', 'Assembly', 'Step', 'Model', 'loadModel')
 
 
-class HashMap(dict):
-    """A custom map type that is hashable. The hash is based upon sorting the keys by their own hash values with the
-    class name as a kind of salt. This means every key must be hashable, and the values of the mapping play no role in
-    the hash value."""
+def _countFalse(data: dict) -> int:
+    return sum(v is False for v in data.values())
+
+
+def _hashKeySet(data: dict) -> int:
+    """Order-independent hash of a dict's key set, via frozenset's C-implemented hash."""
+
+    return hash(frozenset(data))
+
+
+class HashMap:
+    """A custom map type that is hashable. The hash is based upon the set of keys with the class name as a kind of
+    salt. This means every key must be hashable, and the values of the mapping play no role in the hash value. Because
+    computing the hash walks every key, the value is cached on first use and recomputed lazily after any mutation of
+    the keys (values play no role in the hash, but tracking value-only mutations separately is not worth the
+    bookkeeping).
+
+    The type wraps a plain dict in a __slots__ class instead of subclassing dict, which keeps instances __dict__-free
+    and lets reads proxy straight to the C-implemented dict methods. A running count of False values is maintained
+    alongside the dict so completion queries like Part.isPainted are O(1) instead of walking the values."""
+
+    __slots__ = '_data', '_hash', '_nfalse'
+
+    # The class-name salt folded into the hash, precomputed since it never changes. Subclasses wanting their own salt
+    # redefine it.
+    _NAME_HASH = hash('HashMap')
+
+    # Support PaintMap[Paint]-style annotations, which the old dict subclass inherited from dict.
+    __class_getitem__ = classmethod(GenericAlias)
+
+    def __new__(cls, *args, **kwargs):
+        # Saves written while this was a dict subclass replay their items through __setitem__ before any state is
+        # applied, so the slots must be live as soon as the instance exists for those models to keep loading.
+        new = super().__new__(cls)
+        new._data = {}
+        new._hash = None
+        new._nfalse = 0
+        return new
 
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+        self._data = dict(*args, **kwargs)
+        self._hash = None
+        self._nfalse = _countFalse(self._data)
+
+    @classmethod
+    def fromkeys(cls, iterable, value=None):
+        """Build a map with every key set to value in a single C-level call. Like construction, this bypasses
+        __setitem__, so keys must already be validated where that matters (see PaintMap)."""
+
+        new = cls.__new__(cls)
+        new._data = dict.fromkeys(iterable, value)
+        new._hash = None
+        new._nfalse = len(new._data) if value is False else 0
+        return new
 
     def __hash__(self):
-        """Convert the keys to a sorted tuple, relying on the hash of the key's themselves to determine the order.
-        Sorting the keys ensures insertion order of the map does not affect the hash value."""
+        """Hash the keys as a frozenset, whose C-implemented hash is order-independent, so insertion order of the map
+        does not affect the hash value."""
+
+        if self._hash is None:
+            self._hash = self._NAME_HASH ^ _hashKeySet(self._data)
+        return self._hash
+
+    def __eq__(self, other: 'HashMap | dict'):
+        if isinstance(other, HashMap):
+            return self._data == other._data
+        elif isinstance(other, dict):
+            return self._data == other
+        return NotImplemented
+
+    def __getitem__(self, key):
+        return self._data[key]
 
-        return hash((self.__class__.__name__,) + tuple(sorted(self.keys(), key=lambda o: hash(o))))
+    def __setitem__(self, key, value):
+        self._hash = None
+        old = self._data.get(key)
+        self._data[key] = value
+        if (value is False) != (old is False):
+            self._nfalse += 1 if value is False else -1
+
+    def __delitem__(self, key):
+        self._hash = None
+        value = self._data.pop(key)
+        if value is False:
+            self._nfalse -= 1
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def update(self, *args, **kwargs):
+        self._hash = None
+        self._data.update(*args, **kwargs)
+        self._nfalse = _countFalse(self._data)
+
+    def pop(self, *args):
+        self._hash = None
+        n = len(self._data)
+        value = self._data.pop(*args)
+        # Only adjust the count if a key was actually removed (pop with a default may remove nothing).
+        if value is False and len(self._data) != n:
+            self._nfalse -= 1
+        return value
+
+    def popitem(self):
+        self._hash = None
+        item = self._data.popitem()
+        if item[1] is False:
+            self._nfalse -= 1
+        return item
+
+    def clear(self):
+        self._hash = None
+        self._data.clear()
+        self._nfalse = 0
+
+    def setdefault(self, key, default=None):
+        self._hash = None
+        n = len(self._data)
+        value = self._data.setdefault(key, default)
+        if value is False and len(self._data) != n:
+            self._nfalse += 1
+        return value
+
+    def __copy__(self):
+        return self.__class__(self._data)
+
+    def __getstate__(self):
+        # Hash values are salted per process, so the cache must never be persisted.
+        return self._data
+
+    def __setstate__(self, state):
+        self._data = state
+        self._hash = None
+        self._nfalse = _countFalse(state)
+
+    def __str__(self):
+        return str(self._data)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._data!r})'
 
 
 class PaintMap(HashMap):
@@ -27,24 +173,24 @@ class PaintMap(HashMap):
     Color type instead of a Paint type to set a key's value. This of course, results in adding a new key value pair to
     the map. This custom class raises a TypeError when trying to use a Color object as a key."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    __slots__ = ()
+
+    _NAME_HASH = hash('PaintMap')
 
     def __setitem__(self, key, value):
-        """Raising an exception if key is not in the map does not allow the object to be copied with the copy module, so
-        we just strictly enforce the key cannot be a Color type (this is the entire point of defining this class
-        anyway). We also type check the value while we are here as well."""
+        """We strictly enforce the key cannot be a Color type (this is the entire point of defining this class anyway).
+        We also type check the value while we are here as well."""
 
-        if type(key) == Color:
+        if type(key) is Color:
             raise TypeError('Color object used where Paint object was expected.')
         elif value not in (True, False, None):
             raise TypeError(f'value must be True, False, or None, not {value}')
 
-        dict.__setitem__(self, key, value)
+        HashMap.__setitem__(self, key, value)
 
 
 def _checkString(value, name):
-    if not isinstance(value, str):
+    if type(value) is not str:
         raise TypeError(f'{name} must be a str type, not {type(value)}')
 
 
@@ -57,26 +203,26 @@ class Part:
 
         if paints is None:
             self._paints = PaintMap()
-        elif isinstance(paints, Paint):
+        elif type(paints) is Paint:
             self._paints = PaintMap({paints: False})
-        elif isinstance(paints, Sequence):
+        elif type(paints) in _SEQ_TYPES or isinstance(paints, Sequence):
             for p in paints:
-                if not isinstance(p, Paint):
+                if type(p) is not Paint:
                     raise TypeError(f'every element of paints must be a Paint type, not {type(p)}')
-            self._paints = PaintMap(zip(paints, (False,) * len(paints)))
+            self._paints = PaintMap.fromkeys(paints, False)
         else:
             raise TypeError(f'paints must be a Paint instance or a sequence of Paint instances or None, not '
                             f'{type(paints)}')
 
         if decals is None:
             self._decals = HashMap()
-        elif isinstance(decals, Decal):
+        elif type(decals) is Decal:
             self._decals = HashMap({decals: False})
-        elif isinstance(decals, Sequence):
+        elif type(decals) in _SEQ_TYPES or isinstance(decals, Sequence):
             for d in decals:
-                if not isinstance(d, Decal):
+                if type(d) is not Decal:
                     raise TypeError(f'every element of decals must be a Decal type, not {type(d)}')
-            self._decals = HashMap(zip(decals, (False,) * len(decals)))
+            self._decals = HashMap.fromkeys(decals, False)
         else:
             raise TypeError(f'decals must be a Decal instance or a sequence of Decal instances or None, not '
                             f'{type(decals)}')
@@ -113,7 +259,7 @@ class Part:
         """Returns the boolean value for the painted status of paint on this Part. If paint is not in Part.paints, None
         is returned."""
 
-        if not isinstance(paint, Paint):
+        if type(paint) is not Paint:
             raise TypeError(f'paint must be a Paint type, not {type(paint)}')
 
         return self._paints.get(paint)
@@ -122,7 +268,7 @@ class Part:
         """Returns the boolean value for the decaled status of decal on this part. If decal is not in Part.decals, None
         is returned."""
 
-        if not isinstance(decal, Decal):
+        if type(decal) is not Decal:
             raise TypeError(f'decal must be a Decal type, not {type(decal)}')
 
         return self._decals.get(decal)
@@ -130,26 +276,35 @@ class Part:
     def isPainted(self) -> bool:
         """Returns True if the Part is fully painted, False otherwise."""
 
-        for v in self._paints.values():
-            if v is False:
-                return False
-        return True
+        return self._paints._nfalse == 0
 
     def isDecaled(self) -> bool:
         """Returns True if the Part is fully decaled, False otherwise."""
 
-        for v in self._decals.values():
-            if v is False:
-                return False
-        return True
+        return self._decals._nfalse == 0
 
     def isComplete(self) -> bool:
         """Returns True if the Part is fully painted and decaled, False otherwise."""
 
         return self.isPainted() and self.isDecaled()
 
+    def __copy__(self):
+        """Paint and Decal keys are immutable (and interned), so copies reuse them; only the maps themselves are
+        fresh so the painted/decaled statuses diverge independently. The master is preserved -- in particular,
+        Step.__init__'s copies rely on an already-mastered original still raising when re-attached -- while
+        Part.copy hands out detached copies."""
+
+        cls = self.__class__
+        new = cls.__new__(cls)
+        new._id = self._id
+        new._paints = PaintMap(self._paints._data)
+        new._decals = HashMap(self._decals._data)
+        new._master = self._master
+        return new
+
     def copy(self, number: int = 1) -> 'Part | tuple[Part]':
-        """Returns a single or a number of copies of a Part.
+        """Returns a single copy, or a tuple of number copies, of a Part. Copies share the Paint/Decal keys but have
+        independent status maps, and are detached from any Step (their master is reset).
 
         Raises TypeError if number is not an int and a ValueError if number <= 0."""
 
@@ -158,24 +313,41 @@ class Part:
         if number <= 0:
             raise ValueError(f'number must be a positive number, (number = {number})')
         elif number > 1:
-            return (deepcopy(self) for _ in range(number))
+            copies = tuple(self.__copy__() for _ in range(number))
+            for c in copies:
+                c._master = None
+            return copies
         else:
-            return deepcopy(self)
+            new = self.__copy__()
+            new._master = None
+            return new
 
     def __hash__(self):
-        return hash((self._id, self._paints, self._decals))
+        # Not cached at this level: callers hold the live maps through the paints/decals properties and can hash and
+        # mutate them directly, transitions a part-level cache cannot see. With the maps' own caches warm this is
+        # just a 3-tuple hash.
+        return self._computeHash()
+
+    def _computeHash(self):
+        # Refresh the maps' hash caches inline rather than dispatching through their __hash__ methods.
+        paints = self._paints
+        decals = self._decals
+        if paints._hash is None:
+            paints._hash = paints._NAME_HASH ^ _hashKeySet(paints._data)
+        if decals._hash is None:
+            decals._hash = decals._NAME_HASH ^ _hashKeySet(decals._data)
+        return hash((self._id, paints._hash, decals._hash))
 
     def __eq__(self, other: 'Part'):
-        if type(other) == Part:
-            return self.__hash__() == other.__hash__()
+        # Like the hash, equality depends on the map keys only, not the painted/decaled statuses.
+        if type(other) is Part:
+            return (self._id == other._id and self._paints.keys() == other._paints.keys()
+                    and self._decals.keys() == other._decals.keys())
         return NotImplemented
 
     def __str__(self):
-        paintStrings = [f'{str(k)}: {v}' for k, v in self._paints.items()]
-        paintStr = ', '.join(paintStrings)
-
-        decalStrings = [f'{str(k)}: {v}' for k, v in self._decals.items()]
-        decalStr = ', '.join(decalStrings)
+        paintStr = ', '.join(f'{k}: {v}' for k, v in self._paints.items())
+        decalStr = ', '.join(f'{k}: {v}' for k, v in self._decals.items())
 
         return f'\'{self._id}\', {{{paintStr}}}, {{{decalStr}}}'
 
@@ -183,9 +355,9 @@ class Part:
         return f'Part({repr(self._id)}, {repr(self._paints)}, {repr(self._decals)})'
 
     def __contains__(self, item: Paint | Decal):
-        if isinstance(item, Paint):
+        if type(item) is Paint:
             return item in self._paints
-        elif isinstance(item, Decal):
+        elif type(item) is Decal:
             return item in self._decals
         else:
             raise TypeError(f'item must be a Paint or Decal type, not {type(item)}')
@@ -199,10 +371,10 @@ class Assembly(Part):
         # so all new Parts/Assemblies will have a master of None, so master equality still works.
         # self._master = None
 
-        if type(parts) == Part or type(parts) == Assembly:
+        if type(parts) is Part or type(parts) is Assembly:
             parts = (parts,)
 
-        if isinstance(parts, Sequence):
+        if type(parts) in _SEQ_TYPES or isinstance(parts, Sequence):
             partList, assemblies, paints, decals = self._parseParts(parts)
 
             self._parts = partList
@@ -220,20 +392,28 @@ class Assembly(Part):
         partList = []
         assemblies = []
 
+        # Bind the methods used every iteration to locals; this loop runs for every element of every Assembly/Step
+        # construction, so the repeated attribute lookups add up.
+        addPart = partList.append
+        addAssembly = assemblies.append
+        addPaints = paints.update
+        addDecals = decals.update
+
         for p in parts:
-            if type(p) == Part:
-                partList.append(p)
-            elif type(p) == Assembly:
+            t = type(p)
+            if t is Part:
+                addPart(p)
+            elif t is Assembly:
                 # We don't copy assemblies here because we expect an assembly that is part of a larger assembly will
                 # not be 'expanded' to another assembly (using the .attach() method), thus we don't need to force
                 # ambiguities (in memory addresses) for those assemblies.
-                partList.append(p)
-                assemblies.append(p)
+                addPart(p)
+                addAssembly(p)
             else:
-                raise TypeError(f'every element of parts must be a Part or Assembly type, not {type(p)}')
+                raise TypeError(f'every element of parts must be a Part or Assembly type, not {t}')
 
-            paints |= set(p.paints.keys())
-            decals |= set(p.decals.keys())
+            addPaints(p._paints._data)
+            addDecals(p._decals._data)
 
         return partList, assemblies, paints, decals
 
@@ -246,16 +426,30 @@ class Assembly(Part):
         return self._assemblies
 
     def isPainted(self) -> bool:
-        for p in self._parts:
-            if p.isPainted() is False:
-                return False
+        # Walk the flattened tree with an explicit stack instead of recursing through each sub-assembly's isPainted,
+        # so every check is a direct counter read.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for p in node._parts:
+                if type(p) is Part:
+                    if p._paints._nfalse != 0:
+                        return False
+                else:
+                    stack.append(p)
 
         return True
 
     def isDecaled(self) -> bool:
-        for p in self._parts:
-            if p.isDecaled() is False:
-                return False
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for p in node._parts:
+                if type(p) is Part:
+                    if p._decals._nfalse != 0:
+                        return False
+                else:
+                    stack.append(p)
 
         return True
 
@@ -266,7 +460,7 @@ class Assembly(Part):
         part can be either a Part or Assembly type, or a str type whose value is matched against the part's id property.
         """
 
-        if not isinstance(part, str) and not isinstance(part, Part):
+        if type(part) is not str and not isinstance(part, Part):
             raise TypeError(f'part must be a str, Part, or Assembly type, not {type(part)}')
 
         if recursive is not True and recursive is not False:
@@ -275,19 +469,28 @@ class Assembly(Part):
         return self._get(part, recursive, self._master)
 
     def _get(self, part: str, recursive: bool, master: 'Step') -> 'list[Part | Assembly]':
-        if isinstance(part, str):
-            if recursive is True:
-                rtn = [p for p in self._parts if p._id == part]
-            else:
-                rtn = [p for p in self._parts if p._id == part and p._master == master]
-        else:
-            if recursive is True:
-                rtn = [p for p in self._parts if p == part]
+        # An explicit stack avoids the per-level list concatenations and call frames of the old recursive version.
+        # Sub-assemblies are pushed in reverse so they pop in order, keeping the results in the recursion's order.
+        byId = type(part) is str
+        rtn = []
+        matched = rtn.extend
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+            if byId:
+                if recursive is True:
+                    matched(p for p in node._parts if p._id == part)
+                else:
+                    matched(p for p in node._parts if p._id == part and p._master == master)
             else:
-                rtn = [p for p in self._parts if p == part and p._master == master]
+                if recursive is True:
+                    matched(p for p in node._parts if p == part)
+                else:
+                    matched(p for p in node._parts if p == part and p._master == master)
 
-        for a in self._assemblies:
-            rtn += a._get(part, recursive, master)
+            if node._assemblies:
+                stack.extend(reversed(node._assemblies))
 
         return rtn
 
@@ -298,10 +501,10 @@ class Assembly(Part):
         # Any 'old' versions of the Assembly are copied into their Steps, so this master should be reset.
         self._master = None
 
-        if type(parts) == Part or type(parts) == Assembly:
+        if type(parts) is Part or type(parts) is Assembly:
             parts = (parts,)
 
-        if isinstance(parts, Sequence):
+        if type(parts) in _SEQ_TYPES or isinstance(parts, Sequence):
             partList, assemblies, paints, decals = self._parseParts(parts)
 
             self._parts = copy(self._parts) + partList
@@ -338,50 +541,70 @@ class Assembly(Part):
             raise ValueError(f'master values already set')
 
     def getUnpainted(self, paint: Paint = None, recursive=False) -> list[Part]:
-        if paint is not None and not isinstance(paint, Paint):
+        if paint is not None and type(paint) is not Paint:
             raise TypeError(f'paint must be a Paint type, not {type(paint)}')
-        if not isinstance(recursive, bool):
+        if type(recursive) is not bool:
             raise TypeError(f'recursive must be a bool type, not {type(recursive)}')
 
+        # The same explicit-stack walk as _get: one accumulator, sub-assemblies pushed in reverse to keep the
+        # recursion's result order.
         unpainted = []
-        for p in self._parts:
-            if p.paints.get(paint) is False:
-                unpainted.append(p)
+        matched = unpainted.extend
+        stack = [self]
 
-        for a in self._assemblies:
-            unpainted += a.getUnpainted(paint, recursive)
+        while stack:
+            node = stack.pop()
+            matched(p for p in node._parts if p._paints.get(paint) is False)
+            if node._assemblies:
+                stack.extend(reversed(node._assemblies))
 
         return unpainted
 
     def getUndecaled(self, recursive=False) -> list[Decal]:
-        if not isinstance(recursive, bool):
+        if type(recursive) is not bool:
             raise TypeError(f'recursive must be a bool type, not {type(recursive)}')
 
         undecaled = [p for p in self._parts if p.isDecaled() is False]
         if recursive is True:
-            for a in self._assemblies:
-                undecaled.append(a)
+            undecaled.extend(self._assemblies)
 
         return undecaled
 
-    def __hash__(self):
-        return hash((super().__hash__(), tuple(self._parts)))
+    def __copy__(self):
+        """Like Part.__copy__, but the parts themselves are shared between the copies; only the containers holding
+        them are fresh."""
+
+        new = Part.__copy__(self)
+        new._parts = list(self._parts)
+        new._assemblies = list(self._assemblies)
+        return new
+
+    def _computeHash(self):
+        return hash((Part._computeHash(self), tuple(self._parts)))
 
     def __eq__(self, other: 'Assembly'):
         if isinstance(other, Assembly):
-            return self.__hash__() == other.__hash__()
+            # An Assembly and a Step are never equal, even with identical contents -- the Step hash is salted with
+            # the class name -- so the concrete types must match.
+            if type(self) is not type(other):
+                return False
+            return (self._id == other._id and self._paints.keys() == other._paints.keys()
+                    and self._decals.keys() == other._decals.keys() and self._parts == other._parts)
         return NotImplemented
 
+    # Defining __eq__ suppresses the inherited __hash__, so restore it explicitly; like Part, the composite hash is
+    # recomputed each call and only the maps cache.
+    __hash__ = Part.__hash__
+
     def __str__(self):
-        lines = [f'[{str(p)}]' for p in self._parts]
-        parts = '\n'.join(lines)
+        parts = '\n'.join(f'[{p}]' for p in self._parts)
         return f'\'{self._id}\' :\n{parts}'
 
     def __repr__(self):
         return f'Assembly({self._id}, {self._parts})'
 
     def __contains__(self, item: 'Part | Assembly'):
-        if type(item) != Part and type(item) != Assembly:
+        if type(item) is not Part and type(item) is not Assembly:
             raise TypeError(f'item must be a Part or Assembly type, not {type(item)}')
 
         parts = self.get(item, recursive=False)
@@ -398,16 +621,16 @@ class Step(Assembly):
             raise TypeError(f'previous must be None or a Step type, not {type(previous)}')
         self._previous = previous
 
-        if type(parts) == Part:
+        if type(parts) is Part:
             partsArg = (parts,)
-        elif type(parts) == Assembly:
+        elif type(parts) is Assembly:
             partsArg = (copy(parts),)
         else:
             tmp = []
             for p in parts:
-                if type(p) == Part:
+                if type(p) is Part:
                     tmp.append(p)
-                elif type(p) == Assembly:
+                elif type(p) is Assembly:
                     tmp.append(copy(p))
                 else:
                     raise TypeError(f'all elements of parts must be an Assembly or Part type, not {type(p)}')
@@ -423,7 +646,7 @@ class Step(Assembly):
         return self._previous
 
     def get(self, part: 'str | Part | Assembly', recursive=False):
-        if not isinstance(part, str) and not isinstance(part, Part):
+        if type(part) is not str and not isinstance(part, Part):
             raise TypeError(f'part must be a str, Part, or Assembly type, not {type(part)}')
 
         if recursive is not True and recursive is not False:
@@ -431,14 +654,23 @@ class Step(Assembly):
 
         return self._get(part, recursive, self)
 
-    def __hash__(self):
-        return hash((self.__class__.__name__, super().__hash__()))
+    def __copy__(self):
+        new = Assembly.__copy__(self)
+        new._previous = self._previous
+        return new
+
+    _NAME_HASH = hash('Step')
+
+    def _computeHash(self):
+        return self._NAME_HASH ^ Assembly._computeHash(self)
 
     def __eq__(self, other: 'Step'):
         if isinstance(other, Step):
-            return self.__hash__() == other.__hash__()
+            return Assembly.__eq__(self, other)
         return NotImplemented
 
+    __hash__ = Assembly.__hash__
+
     def __str__(self):
         partString = super().__str__().lstrip(f"'{self._id}' :\n")
         return f'Step {self._id}:\n{partString}'
@@ -465,22 +697,22 @@ class Model:
         step = Step(name, parts, previous=previous)
         self._steps.append(step)
 
-        for part in step.parts:
-            if part not in self._parts:
-                self._parts[part.id] = part
-        for assembly in step.assemblies:
-            if assembly not in self._assemblies:
-                self._assemblies[assembly.id] = assembly
-        for paint in step.paints:
-            if paint not in self._paints:
-                if paint.color.code:
-                    key = (paint.color.code, paint.type)
-                else:
-                    key = (paint.color.name, paint.type)
+        # The registries are keyed by id (or the paint key tuple), so membership must be tested against those keys;
+        # testing the objects themselves always missed and made every registration an O(1)-defeating overwrite.
+        for part in step._parts:
+            if part._id not in self._parts:
+                self._parts[part._id] = part
+        for assembly in step._assemblies:
+            if assembly._id not in self._assemblies:
+                self._assemblies[assembly._id] = assembly
+        for paint in step._paints:
+            color = paint._color
+            key = (color._code or color._name, paint._type)
+            if key not in self._paints:
                 self._paints[key] = paint
-        for decal in step.decals:
-            if decal not in self._decals:
-                self._decals[decal.id] = decal
+        for decal in step._decals:
+            if decal._id not in self._decals:
+                self._decals[decal._id] = decal
 
     def getStep(self, number: int | str) -> Step:
         """Return the step by either a number or name. If number is an int, returns the step where number is the
@@ -491,7 +723,7 @@ class Model:
             return self._steps[number - 1]
         elif isinstance(number, str):
             for s in self._steps:
-                if s.id == number:
+                if s._id == number:
                     return s
             raise ValueError(f'no step name matches {number}')
         else:
@@ -502,7 +734,7 @@ class Model:
             filename = self._name
 
         with open(filename, 'wb') as f:
-            dump(self, f)
+            dump(self, f, protocol=HIGHEST_PROTOCOL)
 
     @property
     def name(self):
@@ -3,6 +3,10 @@ from enum import Enum
 
 __all__ = ('PaintType', 'Color', 'ColorMix', 'Paint', 'Decal')
 
+# The concrete sequence types callers actually pass. Checking these before the Sequence ABC short-circuits the
+# expensive __instancecheck__ walk in the common case; the ABC remains the fallback so other sequences still work.
+_SEQ_TYPES = (list, tuple)
+
 
 class PaintType(Enum):
     """Enumeration type to distinguish ways to apply paint to model parts."""
@@ -11,6 +15,13 @@ class PaintType(Enum):
     BRUSH = 2
 
 
+# Canonical instances returned by the Color and Decal constructors. The same colors and decals tend to be constructed
+# over and over while building a model, and every Color also spawns two Paint objects, so interning repeated
+# constructions saves both memory and construction work (and makes identity comparisons meaningful in hot paths).
+_COLOR_CACHE: dict[tuple, 'Color'] = {}
+_DECAL_CACHE: dict[str, 'Decal'] = {}
+
+
 class Color:
     """Color object specifies colors of model paints. While a single color code or name will usually suffice, the Color
     object allows for brand, code and name properties in order to avoid any ambiguities. The brand is required, however
@@ -25,12 +36,49 @@ class Color:
 
     __slots__ = '_brand', '_name', '_code', '_spray', '_brush'
 
+    def __new__(cls, brand: str = None, code: str = None, name: str = None):
+        # Only plain Colors are interned; ColorMix derives its constructor arguments, so it allocates normally. An
+        # unhashable argument falls through so __init__ can raise its usual TypeError. The None defaults can never
+        # match a cached key, so legacy pickles (which call __new__ with no arguments) always allocate fresh.
+        if cls is Color:
+            try:
+                cached = _COLOR_CACHE.get((brand, code, name))
+            except TypeError:
+                cached = None
+            if cached is not None:
+                return cached
+        return super().__new__(cls)
+
+    def __getnewargs__(self):
+        # Pickle copies (and copy.copy) rebuild through __new__ with the real arguments, so they dedupe against the
+        # interning cache instead of colliding on __new__'s defaults.
+        return self._brand, self._code, self._name
+
+    def __setstate__(self, state):
+        # __new__ may have returned an already-interned instance, which must not have its canonical Paint objects
+        # replaced by the unpickled ones; a fresh instance applies the slot state normally.
+        try:
+            self._spray
+            return
+        except AttributeError:
+            pass
+
+        for slot, value in state[1].items():
+            setattr(self, slot, value)
+
     def __init__(self, brand: str, code: str, name: str):
-        if not isinstance(brand, str):
+        try:
+            # An interned instance returned by __new__ is already fully constructed.
+            self._spray
+            return
+        except AttributeError:
+            pass
+
+        if type(brand) is not str:
             raise TypeError(f'brand must be a str type, not {type(brand)}')
-        if not isinstance(code, str):
+        if type(code) is not str:
             raise TypeError(f'code must be a str type, not {type(brand)}')
-        if not isinstance(name, str):
+        if type(name) is not str:
             raise TypeError(f'name must be a str type, not {type(name)}')
 
         if not code and not name:
@@ -44,6 +92,9 @@ class Color:
         self._spray = Paint(self, PaintType.SPRAY)
         self._brush = Paint(self, PaintType.BRUSH)
 
+        if type(self) is Color:
+            _COLOR_CACHE[(brand, code, name)] = self
+
     @property
     def brand(self):
         return self._brand
@@ -75,7 +126,7 @@ class Color:
 
     def __eq__(self, other: 'Color'):
         if isinstance(other, Color):
-            return self.__hash__() == other.__hash__()
+            return (self._brand, self._code, self._name) == (other._brand, other._code, other._name)
         return NotImplemented
 
 
@@ -88,6 +139,9 @@ class ColorMix(Color):
     If all colors have the same brand, the ColorMix will have that brand, otherwise the brand property will be set
     to 'Mixture'."""
 
+    # Without this, subclass instances grow a __dict__ despite Color declaring __slots__.
+    __slots__ = ()
+
     def __init__(self, colors: list[tuple[Color, int]], name: str = ''):
         brand, code = self._checkArgs(colors)
         if brand is False:
@@ -97,37 +151,37 @@ class ColorMix(Color):
 
     @staticmethod
     def _checkArgs(colors: list[tuple[Color, int]]):
-        if not isinstance(colors, Sequence):
+        if type(colors) not in _SEQ_TYPES and not isinstance(colors, Sequence):
             raise TypeError(f'colors must be a Sequence type, not {type(colors)}')
 
-        handles = []
-        brand = colors[0][0].brand
+        # Validate everything in one sweep so the brand and handle construction below can read the slots directly
+        # without re-checking types or going through the property descriptors.
         for c in colors:
-            if not isinstance(c, tuple):
+            if type(c) is not tuple:
                 raise TypeError(f'each element of colors must be a tuple type, not {type(c)}')
             elif (l := len(c)) != 2:
                 raise ValueError(f'each tuple of colors must have exactly two elements, not {l}')
-            else:
-                if not isinstance(c[0], Color):
-                    raise TypeError(f'first element of each colors tuple must be a Color type, not {type(c[0])}')
-                elif not isinstance(c[1], int):
-                    raise TypeError(f'second element of each colors tuple must be an int type, not {type(c[1])}')
-
-                if brand and c[0].brand != brand:
-                    brand = False
-                if c[0].code:
-                    handle = f'{c[0].code}:{c[1]}'
-                elif c[0].name:
-                    handle = f'{c[0].name}:{c[1]}'
-                else:
-                    raise ValueError(f'color ({str(c[0])}) must have either a code or a name (it has neither)')
-                handles.append(handle)
-
-        code = ' + '.join(handles)
+            elif type(c[0]) not in _COLOR_TYPES:
+                raise TypeError(f'first element of each colors tuple must be a Color type, not {type(c[0])}')
+            elif type(c[1]) is not int:
+                raise TypeError(f'second element of each colors tuple must be an int type, not {type(c[1])}')
+            elif not (c[0]._code or c[0]._name):
+                raise ValueError(f'color ({str(c[0])}) must have either a code or a name (it has neither)')
+
+        brand = colors[0][0]._brand
+        if brand and any(c[0]._brand != brand for c in colors):
+            brand = False
+
+        code = ' + '.join(f'{c[0]._code or c[0]._name}:{c[1]}' for c in colors)
 
         return brand, code
 
 
+# Exact color types accepted wherever a Color is expected. Checking type(x) in this frozenset avoids the slower
+# isinstance() MRO traversal in construction hot paths.
+_COLOR_TYPES = frozenset((Color, ColorMix))
+
+
 class Paint:
     """The Paint object specifies how to paint a specific color. The only options for any color are spray, and brush
     (see PaintType enum). A Color object is necessary to instantiate a Paint object, and a Color object can return
@@ -137,9 +191,9 @@ class Paint:
     __slots__ = '_color', '_type'
 
     def __init__(self, color: Color, paintType: PaintType):
-        if not isinstance(color, Color):
+        if type(color) not in _COLOR_TYPES:
             raise TypeError(f'color must be a Color type, not {type(color)}')
-        if not isinstance(paintType, PaintType):
+        if type(paintType) is not PaintType:
             raise TypeError(f'paintType must be a PaintType type, not {type(paintType)}')
 
         self._color = color
@@ -163,8 +217,12 @@ class Paint:
         return hash((self._color, self._type))
 
     def __eq__(self, other: 'Paint'):
+        # With Colors interned, the paints returned by the spray/brush properties are shared, so the identity check
+        # handles most comparisons.
+        if self is other:
+            return True
         if isinstance(other, Paint):
-            return self.__hash__() == other.__hash__()
+            return self._type is other._type and self._color == other._color
         return NotImplemented
 
 
@@ -174,22 +232,48 @@ class Decal:
 
     __slots__ = '_id'
 
+    # Class-name salt folded into the hash, precomputed since it never changes.
+    _NAME_HASH = hash('Decal')
+
+    def __new__(cls, id: str = None):
+        # Subclasses are not interned, and the None default can never match a cached key, so legacy pickles (which
+        # call __new__ with no arguments) always allocate fresh.
+        if cls is Decal:
+            try:
+                cached = _DECAL_CACHE.get(id)
+            except TypeError:
+                cached = None
+            if cached is not None:
+                return cached
+        return super().__new__(cls)
+
+    def __getnewargs__(self):
+        return (self._id,)
+
     def __init__(self, id: str):
-        if not isinstance(id, str):
+        try:
+            self._id
+            return
+        except AttributeError:
+            pass
+
+        if type(id) is not str:
             raise TypeError(f'id must be a str type, not {type(id)}')
 
         self._id = id
+        if type(self) is Decal:
+            _DECAL_CACHE[id] = self
 
     @property
     def id(self):
         return self._id
 
     def __hash__(self):
-        return hash((self.__class__.__name__, self._id))
+        return self._NAME_HASH ^ hash(self._id)
 
     def __eq__(self, other: 'Decal'):
         if isinstance(other, Decal):
-            return self.__hash__() == other.__hash__()
+            return self._id == other._id
         return NotImplemented
 
     def __str__(self):